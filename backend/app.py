@@ -1,8 +1,23 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, send_file, abort
 from flask_cors import CORS
 import requests
 import re
 import time
+import os
+import json
+import copy
+import atexit
+import threading
+import tempfile
+import hashlib
+from io import BytesIO
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
 app = Flask(__name__)
 CORS(app)
@@ -29,6 +44,363 @@ STREAMING_PROVIDERS = {
     "peacock": {"name": "Peacock", "url": "https://www.peacocktv.com"},
 }
 
+# Response cache, persisted to disk so restarted workers start hot
+CACHE_SNAPSHOT_PATH = os.environ.get("CACHE_SNAPSHOT_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache_snapshot.json"))
+GENRE_CACHE_TTL = 60 * 60
+MOVIE_CACHE_TTL = 6 * 60 * 60
+WARMUP_TOP_MOVIES = 20
+WARMUP_WORKERS = 8
+CACHE_SNAPSHOT_INTERVAL = 5 * 60
+MOVIE_REQUEST_COUNTS_MAX = 500
+MOVIE_CACHE_MAX = 1000
+CACHE_MAX_ENTRIES = MOVIE_CACHE_MAX + 200
+# Set to 0 when a server hook (see gunicorn.conf.py) starts warm-up after forking instead
+WARMUP_ON_IMPORT = os.environ.get("WARMUP_ON_IMPORT", "1") == "1"
+
+_cache = {}
+_cache_lock = threading.Lock()
+movie_request_counts = {}
+
+warmup_state = {"ready": False, "started": None, "finished": None, "pid": None, "atexit": False}
+_warmup_lock = threading.Lock()
+
+# Optional poster proxy: serves resized TMDB posters from a local disk cache
+POSTER_PROXY_ENABLED = os.environ.get("POSTER_PROXY", "0") == "1"
+POSTER_PROXY_BASE_URL = os.environ.get("POSTER_PROXY_BASE_URL", "http://localhost:5000")
+POSTER_CACHE_DIR = os.environ.get("POSTER_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "poster_cache"))
+POSTER_CACHE_MAX_BYTES = int(os.environ.get("POSTER_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+POSTER_SOURCE_SIZE = "w342"
+POSTER_THUMB_SIZE = "w185"
+POSTER_SIZES = {"w92": 92, "w154": 154, "w185": 185, "w342": 342}
+POSTER_MAX_AGE = 365 * 24 * 60 * 60
+POSTER_PATH_PATTERN = re.compile(r'^[A-Za-z0-9_-]+\.(jpg|png)$')
+POSTER_MISS_TTL = 10 * 60
+POSTER_MISS_MAX = 1024
+
+POSTER_FILE_PATTERN = re.compile(r'^[0-9a-f]{16}-[0-9a-f]{32}\.(jpg|png)$')
+POSTER_SOURCE_MAX_BYTES = 5 * 1024 * 1024
+
+# This worker's view of POSTER_CACHE_DIR; the byte budget is enforced on the directory itself
+_poster_index = {}
+_poster_disk_bytes = 0
+_poster_bytes_since_scan = 0
+_poster_lock = threading.Lock()
+_poster_evict_lock = threading.Lock()
+# Fixed lock stripes keyed by hash, so concurrent fetches of one poster wait for each other
+_poster_fetch_locks = [threading.Lock() for _ in range(64)]
+_poster_misses = OrderedDict()
+
+def cache_get(key):
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        if entry["expires"] < time.time():
+            del _cache[key]
+            return None
+        return copy.deepcopy(entry["value"])
+
+def cache_set(key, value, ttl):
+    with _cache_lock:
+        _cache[key] = {"value": copy.deepcopy(value), "expires": time.time() + ttl}
+        if len(_cache) > CACHE_MAX_ENTRIES:
+            _prune_cache()
+
+def _prune_cache():
+    """Drop expired entries and the soonest-expiring movie records over the cap; caller holds _cache_lock"""
+    now = time.time()
+    for key in [k for k, v in _cache.items() if v["expires"] < now]:
+        del _cache[key]
+    movie_keys = sorted((k for k in _cache if k.startswith("movie:")), key=lambda k: _cache[k]["expires"])
+    for key in movie_keys[:max(0, len(movie_keys) - MOVIE_CACHE_MAX)]:
+        del _cache[key]
+
+def record_movie_request(movie_id):
+    with _cache_lock:
+        key = str(movie_id)
+        movie_request_counts[key] = movie_request_counts.get(key, 0) + 1
+
+def save_cache_snapshot():
+    """Write live cache entries and movie request counts to disk"""
+    try:
+        now = time.time()
+        with _cache_lock:
+            # Keep only the most requested movies so the counts stay bounded
+            top_counts = sorted(movie_request_counts.items(), key=lambda x: x[1], reverse=True)[:MOVIE_REQUEST_COUNTS_MAX]
+            movie_request_counts.clear()
+            movie_request_counts.update(top_counts)
+            _prune_cache()
+            snapshot = {
+                "saved_at": now,
+                "entries": dict(_cache),
+                "movie_requests": dict(top_counts),
+                "poster_url_mode": poster_url_mode(),
+            }
+        # Each worker writes its own temp file so concurrent saves never interleave
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(CACHE_SNAPSHOT_PATH), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, CACHE_SNAPSHOT_PATH)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        print("Saved cache snapshot: {} entries".format(len(snapshot["entries"])))
+    except Exception as e:
+        print("Error saving cache snapshot: {}".format(e))
+
+def load_cache_snapshot():
+    """Restore unexpired cache entries and movie request counts from disk"""
+    if not os.path.exists(CACHE_SNAPSHOT_PATH):
+        return 0
+    try:
+        with open(CACHE_SNAPSHOT_PATH) as f:
+            snapshot = json.load(f)
+        now = time.time()
+        loaded = 0
+        # Cached results embed poster URLs, so drop them if the proxy mode or host changed
+        entries = snapshot.get("entries", {})
+        if snapshot.get("poster_url_mode") != poster_url_mode():
+            entries = {}
+        with _cache_lock:
+            for key, entry in entries.items():
+                if entry.get("expires", 0) > now:
+                    _cache[key] = entry
+                    loaded += 1
+            for key, count in snapshot.get("movie_requests", {}).items():
+                if not key.isdigit() or not isinstance(count, int):
+                    continue
+                movie_request_counts[key] = max(movie_request_counts.get(key, 0), count)
+        print("Loaded cache snapshot: {} entries".format(loaded))
+        return loaded
+    except Exception as e:
+        print("Error loading cache snapshot: {}".format(e))
+        return 0
+
+def poster_url_mode():
+    return "proxy:{}".format(POSTER_PROXY_BASE_URL) if POSTER_PROXY_ENABLED else "tmdb"
+
+def build_poster_url(poster_path, size=POSTER_SOURCE_SIZE):
+    if not poster_path:
+        return None
+    if POSTER_PROXY_ENABLED:
+        return "{}/api/poster/{}/{}".format(POSTER_PROXY_BASE_URL, size, poster_path.lstrip("/"))
+    return "https://image.tmdb.org/t/p/{}{}".format(POSTER_SOURCE_SIZE, poster_path)
+
+def _poster_key_hash(size, poster_path):
+    return hashlib.sha1("{}/{}".format(size, poster_path).encode()).hexdigest()[:16]
+
+def _scan_poster_dir():
+    """Return (mtime, name, size) for every poster file in the cache dir, oldest access first"""
+    files = []
+    with os.scandir(POSTER_CACHE_DIR) as entries:
+        for dir_entry in entries:
+            if not POSTER_FILE_PATTERN.match(dir_entry.name):
+                continue
+            try:
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, dir_entry.name, stat.st_size))
+    files.sort()
+    return files
+
+def _evict_posters():
+    """Delete least recently used posters until the whole directory fits POSTER_CACHE_MAX_BYTES"""
+    global _poster_disk_bytes, _poster_bytes_since_scan
+    if not _poster_evict_lock.acquire(blocking=False):
+        return
+    try:
+        files = _scan_poster_dir()
+        total = sum(size for _, _, size in files)
+        evicted = 0
+        # Sizing from the directory itself keeps the budget shared by every worker using it
+        for _, name, size in files:
+            if total <= POSTER_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(os.path.join(POSTER_CACHE_DIR, name))
+            except OSError:
+                pass
+            total -= size
+            evicted += 1
+            _poster_forget(name.split("-")[0], name)
+        with _poster_lock:
+            _poster_disk_bytes = total
+            _poster_bytes_since_scan = 0
+        if evicted:
+            print("Evicted {} posters, cache now {} bytes".format(evicted, total))
+    finally:
+        _poster_evict_lock.release()
+
+def load_poster_index():
+    """Rebuild the poster index from files on disk and enforce the byte budget"""
+    global _poster_disk_bytes
+    os.makedirs(POSTER_CACHE_DIR, exist_ok=True)
+    
+    # Fresh temp files may belong to another worker sharing this directory
+    now = time.time()
+    for name in os.listdir(POSTER_CACHE_DIR):
+        if name.endswith(".tmp"):
+            try:
+                full_path = os.path.join(POSTER_CACHE_DIR, name)
+                if os.stat(full_path).st_mtime < now - 60 * 60:
+                    os.remove(full_path)
+            except OSError:
+                pass
+    
+    # Keep only the newest file per key; older duplicates are left over from crashes or other workers
+    files = _scan_poster_dir()
+    newest = {}
+    for mtime, name, size in files:
+        newest[name.split("-")[0]] = (mtime, name, size)
+    stale = [name for _, name, _ in files if newest[name.split("-")[0]][1] != name]
+    for name in stale:
+        try:
+            os.remove(os.path.join(POSTER_CACHE_DIR, name))
+        except OSError:
+            pass
+    
+    with _poster_lock:
+        _poster_index.clear()
+        for key_hash, (_, name, _) in newest.items():
+            _poster_index[key_hash] = {"file": name}
+        _poster_disk_bytes = sum(size for _, _, size in newest.values())
+    print("Loaded poster cache: {} files, {} bytes, removed {} duplicates".format(len(newest), _poster_disk_bytes, len(stale)))
+    if _poster_disk_bytes > POSTER_CACHE_MAX_BYTES:
+        _evict_posters()
+
+def _poster_lookup(key_hash):
+    """Return (entry, data) for a cached poster, or None if it is missing or was evicted"""
+    with _poster_lock:
+        entry = _poster_index.get(key_hash)
+    if entry is None:
+        return None
+    full_path = os.path.join(POSTER_CACHE_DIR, entry["file"])
+    try:
+        # Read the bytes now so a concurrent eviction cannot remove the file before it is served
+        with open(full_path, "rb") as f:
+            data = f.read()
+        # mtime doubles as last-access time, which is the LRU order eviction uses
+        os.utime(full_path)
+    except OSError:
+        _poster_forget(key_hash, entry["file"])
+        return None
+    return entry, data
+
+def _poster_forget(key_hash, name=None):
+    with _poster_lock:
+        entry = _poster_index.get(key_hash)
+        if entry is None or (name is not None and entry["file"] != name):
+            return
+        del _poster_index[key_hash]
+
+def _poster_store(key_hash, data, ext):
+    global _poster_bytes_since_scan
+    content_hash = hashlib.sha256(data).hexdigest()[:32]
+    name = "{}-{}{}".format(key_hash, content_hash, ext)
+    fd, tmp_path = tempfile.mkstemp(dir=POSTER_CACHE_DIR, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, os.path.join(POSTER_CACHE_DIR, name))
+    
+    with _poster_lock:
+        old_entry = _poster_index.get(key_hash)
+        _poster_index[key_hash] = {"file": name}
+        _poster_bytes_since_scan += len(data)
+        # Rescan after a slice of the budget so writes from other workers are noticed too
+        needs_eviction = (_poster_disk_bytes + _poster_bytes_since_scan > POSTER_CACHE_MAX_BYTES
+                          or _poster_bytes_since_scan > POSTER_CACHE_MAX_BYTES // 20)
+        entry = _poster_index[key_hash]
+    if old_entry is not None and old_entry["file"] != name:
+        try:
+            os.remove(os.path.join(POSTER_CACHE_DIR, old_entry["file"]))
+        except OSError:
+            pass
+    if needs_eviction:
+        _evict_posters()
+    return entry, data
+
+def _valid_poster_image(response):
+    """Check an upstream 200 body really is a poster before it is cached for a year"""
+    if not response.headers.get("Content-Type", "").startswith("image/"):
+        return False
+    if not response.content or len(response.content) > POSTER_SOURCE_MAX_BYTES:
+        return False
+    if Image is not None:
+        try:
+            Image.open(BytesIO(response.content)).verify()
+        except Exception:
+            return False
+    return True
+
+def _poster_missing(poster_path):
+    with _poster_lock:
+        expires = _poster_misses.get(poster_path)
+        if expires is None:
+            return False
+        if expires < time.time():
+            del _poster_misses[poster_path]
+            return False
+        return True
+
+def _poster_record_miss(poster_path):
+    with _poster_lock:
+        _poster_misses[poster_path] = time.time() + POSTER_MISS_TTL
+        _poster_misses.move_to_end(poster_path)
+        while len(_poster_misses) > POSTER_MISS_MAX:
+            _poster_misses.popitem(last=False)
+
+def _resize_poster(data, width):
+    """Downscale a poster to the given width, re-encoded as JPEG"""
+    image = Image.open(BytesIO(data))
+    height = round(image.height * width / image.width)
+    image = image.convert("RGB").resize((width, height), Image.LANCZOS)
+    output = BytesIO()
+    image.save(output, format="JPEG", quality=85, optimize=True, progressive=True)
+    return output.getvalue()
+
+class PosterUpstreamError(Exception):
+    """TMDB failed in a way that should not be cached as a missing poster"""
+
+def get_poster_variant(size, poster_path):
+    """Return (entry, data) for a poster size, fetching the source at most once"""
+    # Without Pillow every size is served from the source image
+    if Image is None:
+        size = POSTER_SOURCE_SIZE
+    key_hash = _poster_key_hash(size, poster_path)
+    cached = _poster_lookup(key_hash)
+    if cached is not None:
+        return cached
+    if _poster_missing(poster_path):
+        return None
+    
+    # Resolve the source before taking a lock so a thread never holds two stripes at once
+    source = None
+    if size != POSTER_SOURCE_SIZE:
+        source = get_poster_variant(POSTER_SOURCE_SIZE, poster_path)
+        if source is None:
+            return None
+    
+    with _poster_fetch_locks[int(key_hash, 16) % len(_poster_fetch_locks)]:
+        cached = _poster_lookup(key_hash)
+        if cached is not None:
+            return cached
+        
+        if source is not None:
+            return _poster_store(key_hash, _resize_poster(source[1], POSTER_SIZES[size]), ".jpg")
+        
+        url = "https://image.tmdb.org/t/p/{}/{}".format(POSTER_SOURCE_SIZE, poster_path)
+        response = requests.get(url, timeout=10)
+        if response.status_code == 404:
+            _poster_record_miss(poster_path)
+            return None
+        if response.status_code != 200:
+            raise PosterUpstreamError("TMDB returned {} for {}".format(response.status_code, poster_path))
+        if not _valid_poster_image(response):
+            raise PosterUpstreamError("TMDB returned an invalid image for {}".format(poster_path))
+        return _poster_store(key_hash, response.content, os.path.splitext(poster_path)[1])
+
 def parse_search_query(query):
     query_lower = query.lower()
     
@@ -164,6 +536,11 @@ def get_streaming_providers(movie_id):
     return []
 
 def fetch_movie_details(movie_id):
+    cache_key = "movie:{}".format(movie_id)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
         url = "https://api.themoviedb.org/3/movie/{}?api_key={}&append_to_response=credits,videos,production_companies".format(movie_id, TMDB_API_KEY)
         response = requests.get(url, timeout=10)
@@ -183,7 +560,7 @@ def fetch_movie_details(movie_id):
         runtime_str = "{} min".format(runtime) if runtime else "Unknown"
         
         poster_path = data.get("poster_path")
-        poster_url = "https://image.tmdb.org/t/p/w342{}".format(poster_path) if poster_path else None
+        poster_url = build_poster_url(poster_path)
         
         cast = []
         credits = data.get("credits", {})
@@ -213,7 +590,7 @@ def fetch_movie_details(movie_id):
         vote_average = data.get("vote_average", 0)
         rating = round(vote_average, 1) if vote_average > 0 else "N/A"
         
-        return {
+        movie_details = {
             "tmdbID": movie_id,
             "Title": title,
             "Year": year,
@@ -230,6 +607,8 @@ def fetch_movie_details(movie_id):
             "StreamingProviders": streaming_providers,
             "vote_count": data.get("vote_count", 0)
         }
+        cache_set(cache_key, movie_details, MOVIE_CACHE_TTL)
+        return movie_details
     except Exception as e:
         print("Error fetching movie details: {}".format(e))
         return None
@@ -289,7 +668,7 @@ def search_movies_by_actor(actor_name, page=1):
                             continue
                         
                         poster_path = item.get("poster_path")
-                        poster_url = "https://image.tmdb.org/t/p/w342{}".format(poster_path) if poster_path else None
+                        poster_url = build_poster_url(poster_path, POSTER_THUMB_SIZE)
                         
                         genre_ids = item.get("genre_ids", [])
                         genre_names = []
@@ -355,7 +734,7 @@ def search_movies_by_company(company_name, page=1):
                                     break
                         
                         poster_path = item.get("poster_path")
-                        poster_url = "https://image.tmdb.org/t/p/w342{}".format(poster_path) if poster_path else None
+                        poster_url = build_poster_url(poster_path, POSTER_THUMB_SIZE)
                         
                         movie_data = {
                             "tmdbID": item.get("id"),
@@ -407,7 +786,7 @@ def search_movies(query, year=None, page=1):
                             break
                 
                 poster_path = item.get("poster_path")
-                poster_url = "https://image.tmdb.org/t/p/w342{}".format(poster_path) if poster_path else None
+                poster_url = build_poster_url(poster_path, POSTER_THUMB_SIZE)
                 
                 plot = item.get("overview", "No description available")
                 if plot and len(plot) > 120:
@@ -437,20 +816,24 @@ def discover_by_genre(genre, year=None, max_results=12):
         genre_id = GENRES.get(genre)
         if not genre_id:
             return []
+        
+        if not year:
+            year = time.strftime("%Y")
+        
+        # Cache the whole result page so trending, recommend and search share it
+        cache_key = "genre:{}:{}".format(genre, year)
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return cached[:max_results]
             
         url = "https://api.themoviedb.org/3/discover/movie?api_key={}&with_genres={}&sort_by=popularity.desc".format(TMDB_API_KEY, genre_id)
-        
-        if year:
-            url += "&primary_release_year={}".format(year)
-        else:
-            current_year = time.strftime("%Y")
-            url += "&primary_release_year={}".format(current_year)
+        url += "&primary_release_year={}".format(year)
         
         response = requests.get(url, timeout=5)
         if response.status_code == 200:
             data = response.json()
             movies = []
-            for item in data.get("results", [])[:max_results]:
+            for item in data.get("results", []):
                 title = item.get("title", "Unknown Title")
                 release_date = item.get("release_date", "")
                 item_year = release_date.split("-")[0] if release_date else "Unknown"
@@ -464,7 +847,7 @@ def discover_by_genre(genre, year=None, max_results=12):
                             break
                 
                 poster_path = item.get("poster_path")
-                poster_url = "https://image.tmdb.org/t/p/w342{}".format(poster_path) if poster_path else None
+                poster_url = build_poster_url(poster_path, POSTER_THUMB_SIZE)
                 
                 plot = item.get("overview", "No description available")
                 if plot and len(plot) > 120:
@@ -481,7 +864,8 @@ def discover_by_genre(genre, year=None, max_results=12):
                     "genres_list": genre_names,
                 }
                 movies.append(movie_data)
-            return movies
+            cache_set(cache_key, movies, GENRE_CACHE_TTL)
+            return movies[:max_results]
     except Exception as e:
         print("Discover error: {}".format(e))
     return []
@@ -530,6 +914,57 @@ def calculate_relevance_score(movie, query_terms, found_genres, target_year, act
     
     return score
 
+def warm_up():
+    """Load the cache snapshot and prefetch genre lists and popular movie details"""
+    top_movies = []
+    try:
+        load_cache_snapshot()
+        
+        current_year = time.strftime("%Y")
+        with _cache_lock:
+            top_movies = [movie_id for movie_id, _ in sorted(movie_request_counts.items(), key=lambda x: x[1], reverse=True) if movie_id.isdigit()][:WARMUP_TOP_MOVIES]
+        
+        with ThreadPoolExecutor(max_workers=WARMUP_WORKERS) as executor:
+            futures = [executor.submit(discover_by_genre, genre, current_year) for genre in GENRES]
+            futures += [executor.submit(fetch_movie_details, int(movie_id)) for movie_id in top_movies]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    print("Warm-up error: {}".format(e))
+        
+        save_cache_snapshot()
+    except Exception as e:
+        print("Warm-up failed, serving cold: {}".format(e))
+    finally:
+        # Always report ready so a failed warm-up degrades to cold serving rather than a permanent 503
+        warmup_state["finished"] = time.time()
+        warmup_state["ready"] = True
+    print("Warm-up completed: {} genres, {} movies in {:.2f}s".format(len(GENRES), len(top_movies), warmup_state["finished"] - warmup_state["started"]))
+
+def snapshot_saver():
+    # atexit does not run on SIGTERM, so save periodically to survive deploys
+    while True:
+        time.sleep(CACHE_SNAPSHOT_INTERVAL)
+        save_cache_snapshot()
+
+def start_warm_up():
+    """Start warm-up once per serving process, including each forked worker"""
+    with _warmup_lock:
+        if warmup_state["pid"] == os.getpid():
+            return
+        warmup_state.update({"ready": False, "started": time.time(), "finished": None, "pid": os.getpid()})
+        if not warmup_state["atexit"]:
+            warmup_state["atexit"] = True
+            atexit.register(save_cache_snapshot)
+    threading.Thread(target=warm_up, daemon=True).start()
+    threading.Thread(target=snapshot_saver, daemon=True).start()
+
+# Fallback for servers that fork without a post_fork hook: warm up on the worker's first request
+@app.before_request
+def ensure_warm_up():
+    start_warm_up()
+
 @app.route("/api/search", methods=["POST"])
 def search():
     start_time = time.time()
@@ -644,6 +1079,7 @@ def get_movie(movie_id):
     try:
         movie_details = fetch_movie_details(movie_id)
         if movie_details:
+            record_movie_request(movie_id)
             return jsonify(movie_details)
         else:
             return jsonify({"error": "Movie not found"}), 404
@@ -672,9 +1108,60 @@ def get_streaming_providers_route(movie_id):
         print("Streaming providers error: {}".format(e))
         return jsonify({"error": "Internal server error"}), 500
 
+@app.route("/api/poster/<size>/<poster_path>", methods=["GET"])
+def get_poster(size, poster_path):
+    if not POSTER_PROXY_ENABLED:
+        abort(404)
+    if size not in POSTER_SIZES or not POSTER_PATH_PATTERN.match(poster_path):
+        return jsonify({"error": "Invalid poster request"}), 400
+    try:
+        poster = get_poster_variant(size, poster_path)
+    except (PosterUpstreamError, requests.RequestException) as e:
+        print("Poster upstream error: {}".format(e))
+        return jsonify({"error": "Poster upstream unavailable"}), 502
+    except Exception as e:
+        print("Poster error: {}".format(e))
+        return jsonify({"error": "Internal server error"}), 500
+    if poster is None:
+        return jsonify({"error": "Poster not found"}), 404
+    
+    entry, data = poster
+    content_hash, ext = os.path.splitext(entry["file"].rsplit("-", 1)[1])
+    response = send_file(
+        BytesIO(data),
+        mimetype="image/png" if ext == ".png" else "image/jpeg",
+        conditional=True,
+        etag=content_hash,
+        max_age=POSTER_MAX_AGE,
+    )
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
 @app.route("/", methods=["GET"])
 def health_check():
+    if not warmup_state["ready"]:
+        return jsonify({"status": "WARMING", "message": "CineMatch API is warming up"}), 503
     return jsonify({"status": "OK", "message": "CineMatch API is running"})
 
+@app.route("/health/live", methods=["GET"])
+def liveness_check():
+    return jsonify({"status": "OK"})
+
+@app.route("/health/ready", methods=["GET"])
+def readiness_check():
+    if not warmup_state["ready"]:
+        return jsonify({"status": "WARMING"}), 503
+    return jsonify({"status": "OK", "warmupTime": round(warmup_state["finished"] - warmup_state["started"], 2)})
+
+if POSTER_PROXY_ENABLED:
+    load_poster_index()
+
+if WARMUP_ON_IMPORT and __name__ != "__main__":
+    start_warm_up()
+
 if __name__ == "__main__":
+    # The debug reloader's parent process never serves requests, so only warm up in the serving process
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_warm_up()
     app.run(debug=True, port=5000, host='0.0.0.0')
\ No newline at end of file
@@ -0,0 +1,12 @@
+import os
+
+bind = "0.0.0.0:5000"
+workers = int(os.environ.get("WEB_CONCURRENCY", 4))
+preload_app = os.environ.get("GUNICORN_PRELOAD", "0") == "1"
+
+# Warm-up runs per worker from post_fork, so importing the app (in the master when preloading) must not start it
+os.environ.setdefault("WARMUP_ON_IMPORT", "0")
+
+def post_fork(server, worker):
+    from app import start_warm_up
+    start_warm_up()